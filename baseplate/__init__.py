@@ -55,6 +55,9 @@ _ExcInfo = Tuple[Optional[Type[BaseException]], Optional[BaseException], Optiona
 class SpanObserver:
     """Interface for an observer that watches a span."""
 
+    # Allow subclasses to use __slots__ for their state.
+    __slots__ = ()
+
     def on_start(self) -> None:
         """Do something when the observed span is started."""
 
@@ -1,5 +1,8 @@
 """Components for processing Baseplate spans for service request tracing."""
 import collections
+import functools
+import gzip
+import itertools
 import json
 import logging
 import queue
@@ -9,9 +12,9 @@ import threading
 import time
 import typing
 
-from datetime import datetime
 from typing import Any
 from typing import DefaultDict
+from typing import Deque
 from typing import Dict
 from typing import List
 from typing import NamedTuple
@@ -34,10 +37,12 @@ from baseplate.lib.message_queue import TimedOutError
 from baseplate.observers.timeout import ServerTimeout
 
 
-if typing.TYPE_CHECKING:
-    SpanQueue = queue.Queue["TraceSpanObserver"]  # pylint: disable=unsubscriptable-object
-else:
-    SpanQueue = queue.Queue
+try:
+    # orjson is considerably faster than the stdlib json module when serializing
+    # batches of spans, so use it if it's available.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 
 logger = logging.getLogger(__name__)
@@ -57,6 +62,13 @@ ANNOTATIONS = {
     "ERROR": "error",
 }
 
+# The core Zipkin time annotations, bound once so that serializing a span
+# doesn't have to look them up in ANNOTATIONS every time.
+_CLIENT_SEND = ANNOTATIONS["CLIENT_SEND"]
+_CLIENT_RECEIVE = ANNOTATIONS["CLIENT_RECEIVE"]
+_SERVER_SEND = ANNOTATIONS["SERVER_SEND"]
+_SERVER_RECEIVE = ANNOTATIONS["SERVER_RECEIVE"]
+
 # Feature flags
 FLAGS = {
     # Ensures the trace passes ALL samplers
@@ -68,12 +80,38 @@ FLAGS = {
 MAX_SPAN_SIZE = 102400
 # Max number of spans iallowed in POSIX queue at one time
 MAX_QUEUE_SIZE = 10000
+# Max number of finished span observers kept around for reuse, per class
+MAX_POOLED_OBSERVERS = 64
+# Fraction of the batch recorder queue that may fill up before spans are shed
+SHED_SPANS_THRESHOLD = 0.8
+# Every additional fraction of the queue filled up halves the spans kept
+SHED_SPANS_STEP = 0.05
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf8")
+
+
+@functools.lru_cache(maxsize=1)
+def _local_ipv4() -> str:
+    """Return the IPv4 address of this host.
+
+    This is resolved only once per process so that creating observers doesn't
+    block on DNS.
+    """
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except socket.gaierror as e:
+        logger.warning("Hostname could not be resolved, error=%s", e)
+        return "undefined"
 
 
 def current_epoch_microseconds() -> int:
     """Return current UTC time since epoch in microseconds."""
-    epoch_ts = datetime.utcfromtimestamp(0)
-    return int((datetime.utcnow() - epoch_ts).total_seconds() * 1000 * 1000)
+    return int(time.time() * 1_000_000)
 
 
 class TracingClient(NamedTuple):
@@ -87,7 +125,7 @@ def make_client(
     tracing_endpoint: Optional[config.EndpointConfiguration] = None,
     tracing_queue_name: Optional[str] = None,
     max_span_queue_size: int = 50000,
-    num_span_workers: int = 5,
+    num_span_workers: int = 2,
     span_batch_interval: float = 0.5,
     num_conns: int = 100,
     sample_rate: float = 0.1,
@@ -154,11 +192,10 @@ class TraceBaseplateObserver(BaseplateObserver):
         self.service_name = tracing_client.service_name
         self.sample_rate = tracing_client.sample_rate
         self.recorder = tracing_client.recorder
-        try:
-            self.hostname = socket.gethostbyname(socket.gethostname())
-        except socket.gaierror as e:
-            logger.warning("Hostname could not be resolved, error=%s", e)
-            self.hostname = "undefined"
+        self.hostname = _local_ipv4()
+        # The endpoint is identical for every span this observer creates, so
+        # build it once and share it between all annotations.
+        self._endpoint = {"serviceName": self.service_name, "ipv4": self.hostname}
 
     @classmethod
     def force_sampling(cls, span: Span) -> bool:
@@ -178,7 +215,11 @@ class TraceBaseplateObserver(BaseplateObserver):
         if self.should_sample(server_span):
             server_span.sampled = True
             observer = TraceServerSpanObserver(
-                self.service_name, self.hostname, server_span, self.recorder
+                self.service_name,
+                self.hostname,
+                server_span,
+                self.recorder,
+                endpoint=self._endpoint,
             )
             server_span.register(observer)
         else:
@@ -190,26 +231,79 @@ class TraceSpanObserver(SpanObserver):
 
     This observer implements the client-side span portion of a
     Zipkin request trace.
+
+    The span is serialized when it finishes and only the serialized form is
+    passed on to the recorder, so the observer is released for reuse right
+    away and construction reuses a released instance of the same class when
+    one is available.
+
+    :param service_name: The name for the service this observer is registered
+        to.
+    :param hostname: Name identifying the host of the service.
+    :param span: Span for this observer.
+    :param recorder: Recorder for span trace.
+    :param endpoint: Optional pre-built Zipkin endpoint for
+        ``service_name``/``hostname`` to share between observers.
     """
 
-    def __init__(self, service_name: str, hostname: str, span: Span, recorder: "Recorder"):
+    __slots__ = (
+        "service_name",
+        "hostname",
+        "_endpoint",
+        "recorder",
+        "span",
+        "start",
+        "binary_annotations",
+        "counters",
+        "_released",
+    )
+
+    # Free list of released observers. Each subclass gets its own list so that
+    # reused instances always have the right type. list.pop() and
+    # list.append() are atomic so this is safe to share between threads (and
+    # unlike threading.local, still shared between greenlets under gevent).
+    _pool: List["TraceSpanObserver"] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "TraceSpanObserver":
+        try:
+            return cls._pool.pop()
+        except IndexError:
+            return super().__new__(cls)
+
+    def __init__(
+        self,
+        service_name: str,
+        hostname: str,
+        span: Span,
+        recorder: "Recorder",
+        endpoint: Optional[Dict[str, str]] = None,
+    ):
         self.service_name = service_name
         self.hostname = hostname
+        self._endpoint = endpoint or {"serviceName": service_name, "ipv4": hostname}
         self.recorder = recorder
         self.span = span
+        self._released = False
         self.start: Optional[int] = None
-        self.end: Optional[int] = None
-        self.elapsed: Optional[int] = None
         self.binary_annotations: List[Dict[str, Any]] = []
-        self.counters: DefaultDict[str, float] = collections.defaultdict(float)
+        # Most spans never increment a tag, so only allocate counters on demand.
+        self.counters: Optional[DefaultDict[str, float]] = None
         self.on_set_tag(ANNOTATIONS["COMPONENT"], "baseplate")
         super().__init__()
 
     def on_start(self) -> None:
         self.start = current_epoch_microseconds()
-        self.client_send = self.start
 
     def on_finish(self, exc_info: Optional[_ExcInfo]) -> None:
+        # The span has already been recorded and this observer may already be
+        # in use for another span.
+        if self._released:
+            return
+
         if exc_info:
             self.on_set_tag(ANNOTATIONS["ERROR"], True)
 
@@ -218,13 +312,37 @@ class TraceSpanObserver(SpanObserver):
         if self.span.flags and (self.span.flags & FLAGS["DEBUG"]):
             self.on_set_tag(ANNOTATIONS["DEBUG"], True)
 
-        self.end = current_epoch_microseconds()
-        self.elapsed = self.end - typing.cast(int, self.start)
+        end = current_epoch_microseconds()
+
+        if self.counters:
+            for key, value in self.counters.items():
+                self.binary_annotations.append(
+                    self._create_binary_annotation(f"counter.{key}", value)
+                )
+
+        self.recorder.send(self._serialize(typing.cast(int, self.start), end))
+        self._release()
+
+    def _release(self) -> None:
+        """Return this observer to the free list for reuse.
 
-        for key, value in self.counters.items():
-            self.binary_annotations.append(self._create_binary_annotation(f"counter.{key}", value))
+        This must only be called once the observer's span has finished.
+        Releasing an observer more than once does nothing, so that the same
+        instance can't end up in the free list twice. The span and recorder
+        are dropped so that pooled observers don't keep them alive. Other
+        state is left as-is until the instance is reinitialized on reuse,
+        which assigns fresh annotation lists so that previously serialized
+        spans sharing the old ones remain intact.
+        """
+        if self._released:
+            return
+        self._released = True
+        del self.span
+        del self.recorder
 
-        self.recorder.send(self)
+        pool = type(self)._pool
+        if len(pool) < MAX_POOLED_OBSERVERS:
+            pool.append(self)
 
     def on_set_tag(self, key: str, value: Any) -> None:
         """Translate set tags to tracing binary annotations.
@@ -234,18 +352,17 @@ class TraceSpanObserver(SpanObserver):
         self.binary_annotations.append(self._create_binary_annotation(key, value))
 
     def on_incr_tag(self, key: str, delta: float) -> None:
+        if self.counters is None:
+            self.counters = collections.defaultdict(float)
         self.counters[key] += delta
 
-    def _endpoint_info(self) -> Dict[str, str]:
-        return {"serviceName": self.service_name, "ipv4": self.hostname}
-
     def _create_time_annotation(self, annotation_type: str, timestamp: int) -> Dict[str, Any]:
         """Create Zipkin-compatible Annotation for a span.
 
         This should be used for generating span annotations with a time component,
         e.g. the core "cs", "cr", "ss", and "sr" Zipkin Annotations
         """
-        return {"endpoint": self._endpoint_info(), "timestamp": timestamp, "value": annotation_type}
+        return {"endpoint": self._endpoint, "timestamp": timestamp, "value": annotation_type}
 
     def _create_binary_annotation(
         self, annotation_type: str, annotation_value: Any
@@ -255,8 +372,6 @@ class TraceSpanObserver(SpanObserver):
         This should be used for generating span annotations that
         do not have a time component, e.g. URI, arbitrary request tags
         """
-        endpoint_info = self._endpoint_info()
-
         # Annotation values must be str type.
         if isinstance(annotation_value, bool):
             # only "lower" bool values so we aren't affecting any other types
@@ -264,37 +379,34 @@ class TraceSpanObserver(SpanObserver):
         elif not isinstance(annotation_value, str):
             annotation_value = str(annotation_value)
 
-        return {"key": annotation_type, "value": annotation_value, "endpoint": endpoint_info}
+        return {"key": annotation_type, "value": annotation_value, "endpoint": self._endpoint}
 
     def _to_span_obj(
-        self, annotations: List[Dict[str, Any]], binary_annotations: List[Dict[str, Any]]
+        self,
+        start: int,
+        end: int,
+        annotations: List[Dict[str, Any]],
+        binary_annotations: List[Dict[str, Any]],
     ) -> Dict[str, Any]:
-        span = {
-            "traceId": self.span.trace_id,
-            "name": self.span.name,
-            "id": self.span.id,
-            "timestamp": self.start,
-            "duration": self.elapsed,
+        span = self.span
+        return {
+            "traceId": span.trace_id,
+            "name": span.name,
+            "id": span.id,
+            "timestamp": start,
+            "duration": end - start,
             "annotations": annotations,
             "binaryAnnotations": binary_annotations,
+            "parentId": span.parent_id or 0,
         }
 
-        span["parentId"] = self.span.parent_id or 0
-        return span
-
-    def _serialize(self) -> Dict[str, Any]:
+    def _serialize(self, start: int, end: int) -> Dict[str, Any]:
         """Serialize span information into Zipkin-accepted format."""
-        annotations = []
-
-        annotations.append(
-            self._create_time_annotation(ANNOTATIONS["CLIENT_SEND"], typing.cast(int, self.start))
-        )
-
-        annotations.append(
-            self._create_time_annotation(ANNOTATIONS["CLIENT_RECEIVE"], typing.cast(int, self.end))
-        )
-
-        return self._to_span_obj(annotations, self.binary_annotations)
+        annotations = [
+            self._create_time_annotation(_CLIENT_SEND, start),
+            self._create_time_annotation(_CLIENT_RECEIVE, end),
+        ]
+        return self._to_span_obj(start, end, annotations, self.binary_annotations)
 
 
 class TraceLocalSpanObserver(TraceSpanObserver):
@@ -307,8 +419,12 @@ class TraceLocalSpanObserver(TraceSpanObserver):
     :param hostname: Name identifying the host of the service.
     :param span: Local span for this observer.
     :param recorder: Recorder for span trace.
+    :param endpoint: Optional pre-built Zipkin endpoint for
+        ``service_name``/``hostname`` to share between observers.
     """
 
+    __slots__ = ("component_name",)
+
     def __init__(
         self,
         service_name: str,
@@ -316,9 +432,10 @@ class TraceLocalSpanObserver(TraceSpanObserver):
         hostname: str,
         span: Span,
         recorder: "Recorder",
+        endpoint: Optional[Dict[str, str]] = None,
     ):
         self.component_name = component_name
-        super().__init__(service_name, hostname, span, recorder)
+        super().__init__(service_name, hostname, span, recorder, endpoint)
         self.binary_annotations.append(
             self._create_binary_annotation(ANNOTATIONS["LOCAL_COMPONENT"], self.component_name)
         )
@@ -340,16 +457,17 @@ class TraceLocalSpanObserver(TraceSpanObserver):
                 self.hostname,
                 span,
                 self.recorder,
+                endpoint=self._endpoint,
             )
 
         else:
             trace_observer = TraceSpanObserver(
-                self.service_name, self.hostname, span, self.recorder
+                self.service_name, self.hostname, span, self.recorder, endpoint=self._endpoint
             )
         span.register(trace_observer)
 
-    def _serialize(self) -> Dict[str, Any]:
-        return self._to_span_obj([], self.binary_annotations)
+    def _serialize(self, start: int, end: int) -> Dict[str, Any]:
+        return self._to_span_obj(start, end, [], self.binary_annotations)
 
 
 class TraceServerSpanObserver(TraceSpanObserver):
@@ -359,16 +477,15 @@ class TraceServerSpanObserver(TraceSpanObserver):
     Zipkin request trace
     """
 
-    def __init__(self, service_name: str, hostname: str, span: Span, recorder: "Recorder"):
-        self.service_name = service_name
-        self.span = span
-        self.recorder = recorder
-        super().__init__(service_name, hostname, span, recorder)
+    __slots__ = ()
 
     def on_start(self) -> None:
         self.start = current_epoch_microseconds()
 
     def on_finish(self, exc_info: Optional[_ExcInfo]) -> None:
+        if self._released:
+            return
+
         if exc_info and exc_info[0] is not None and issubclass(ServerTimeout, exc_info[0]):
             self.on_set_tag("timed_out", True)
 
@@ -388,75 +505,189 @@ class TraceServerSpanObserver(TraceSpanObserver):
                 self.hostname,
                 span,
                 self.recorder,
+                endpoint=self._endpoint,
             )
 
         else:
             trace_observer = TraceSpanObserver(
-                self.service_name, self.hostname, span, self.recorder
+                self.service_name, self.hostname, span, self.recorder, endpoint=self._endpoint
             )
         span.register(trace_observer)
 
-    def _serialize(self) -> Dict[str, Any]:
+    def _serialize(self, start: int, end: int) -> Dict[str, Any]:
         """Serialize span information into Zipkin-accepted format."""
-        annotations: List[Dict[str, Any]] = []
-
-        annotations.append(
-            self._create_time_annotation(
-                ANNOTATIONS["SERVER_RECEIVE"], typing.cast(int, self.start)
-            )
-        )
-        annotations.append(
-            self._create_time_annotation(ANNOTATIONS["SERVER_SEND"], typing.cast(int, self.end))
-        )
-
-        return self._to_span_obj(annotations, self.binary_annotations)
+        annotations = [
+            self._create_time_annotation(_SERVER_RECEIVE, start),
+            self._create_time_annotation(_SERVER_SEND, end),
+        ]
+        return self._to_span_obj(start, end, annotations, self.binary_annotations)
 
 
 class Recorder:
-    def send(self, span: TraceSpanObserver) -> None:
+    def send(self, span: Dict[str, Any]) -> None:
         raise NotImplementedError
 
 
+class SpanQueue:
+    """A bounded FIFO of JSON encoded spans waiting to be flushed.
+
+    Appending to and popping from a :py:class:`collections.deque` are atomic,
+    so unlike :py:class:`queue.Queue` no locks are taken when adding or
+    removing spans. An event is only used to wake up consumers waiting on an
+    empty queue.
+
+    When the queue is full, adding a span drops the oldest one. A maxsize of
+    zero or less means the queue is unbounded.
+
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._spans: Deque[bytes] = collections.deque(maxlen=maxsize if maxsize > 0 else None)
+        self._not_empty = threading.Event()
+
+    def qsize(self) -> int:
+        return len(self._spans)
+
+    def put(self, span: bytes) -> bool:
+        """Add a span to the queue.
+
+        :return: :py:data:`False` if the queue was full and the oldest span
+            was dropped to make room.
+
+        """
+        full = 0 < self.maxsize <= len(self._spans)
+        self._spans.append(span)
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+        return not full
+
+    def get_nowait(self) -> bytes:
+        """Remove and return the oldest span, raising queue.Empty if there is none."""
+        try:
+            return self._spans.popleft()
+        except IndexError:
+            raise queue.Empty
+
+    def get(self, timeout: float) -> bytes:
+        """Remove and return the oldest span, waiting up to timeout seconds for one."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._spans.popleft()
+            except IndexError:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise queue.Empty
+
+            # clear before checking again so a span added in the meantime
+            # either gets seen here or sets the event again.
+            self._not_empty.clear()
+            if not self._spans:
+                self._not_empty.wait(remaining)
+
+
 class BaseBatchRecorder(Recorder):
     def __init__(
-        self, max_queue_size: int, num_workers: int, max_span_batch: int, batch_wait_interval: float
+        self,
+        max_queue_size: int,
+        num_workers: int,
+        max_span_batch: int,
+        batch_wait_interval: float,
+        coalesce_window: float = 0.005,
     ):
-        self.span_queue: SpanQueue = queue.Queue(maxsize=max_queue_size)
+        self.span_queue = SpanQueue(maxsize=max_queue_size)
         self.batch_wait_interval = batch_wait_interval
         self.max_span_batch = max_span_batch
+        self.coalesce_window = coalesce_window
         self.logger = logging.getLogger(self.__class__.__name__)
-        for _ in range(num_workers):
-            self.flush_worker = threading.Thread(target=self._flush_spans)
-            self.flush_worker.name = "span recorder"
-            self.flush_worker.daemon = True
-            self.flush_worker.start()
-
-    def flush_func(self, spans: List[Dict[str, Any]]) -> None:
+        # Backlog above which spans start being shed.
+        self._shed_backlog = (
+            SHED_SPANS_THRESHOLD * max_queue_size if max_queue_size > 0 else float("inf")
+        )
+        self._dropped_spans = itertools.count(1)
+        self._last_drop_warning = -float("inf")
+
+        # Flushing is mostly waiting on I/O, so a couple of workers is usually
+        # enough to keep up with the collector.
+        self._workers: List[threading.Thread] = []
+        for i in range(num_workers):
+            worker = threading.Thread(target=self._flush_spans, name=f"span-recorder-{i}")
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def flush_func(self, spans: List[bytes]) -> None:
         raise NotImplementedError
 
-    def _flush_spans(self) -> None:
-        # This reads a batch of at most max_span_batch spans off the recorder queue
-        # and sends them to a remote recording endpoint. If the queue
-        # empties while being processed before reaching 10 spans, we flush
-        # immediately.
-        while True:
-            spans: List[Dict[str, Any]] = []
+    def _get_batch(self) -> List[bytes]:
+        # This blocks for up to batch_wait_interval waiting for a span to
+        # arrive, then keeps collecting spans for up to coalesce_window so
+        # that bursts get flushed together rather than as many small batches.
+        # Once the window has passed, whatever is already on the queue is
+        # still added until the batch holds max_span_batch spans.
+        try:
+            spans = [self.span_queue.get(timeout=self.batch_wait_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.coalesce_window
+        while len(spans) < self.max_span_batch:
+            remaining = deadline - time.monotonic()
             try:
-                while len(spans) < self.max_span_batch:
-                    spans.append(self.span_queue.get_nowait()._serialize())
-            except queue.Empty:
-                pass
-            finally:
-                if spans:
-                    self.flush_func(spans)
+                if remaining > 0:
+                    spans.append(self.span_queue.get(timeout=remaining))
                 else:
-                    time.sleep(self.batch_wait_interval)
+                    spans.append(self.span_queue.get_nowait())
+            except queue.Empty:
+                break
+        return spans
 
-    def send(self, span: TraceSpanObserver) -> None:
-        try:
-            self.span_queue.put_nowait(span)
-        except Exception as e:
-            self.logger.warning("Failed adding span to recording queue: %s", e)
+    def _flush_spans(self) -> None:
+        # This reads batches of spans off the recorder queue and sends them to
+        # a remote recording endpoint.
+        while True:
+            spans = self._get_batch()
+            if spans:
+                self.flush_func(spans)
+
+    def _keep_probability(self, backlog: int) -> float:
+        # Once the queue is more than SHED_SPANS_THRESHOLD full, halve the
+        # share of traces kept for every further SHED_SPANS_STEP of it that
+        # fills up. This sheds load gradually rather than waiting for the
+        # queue to overflow.
+        maxsize = self.span_queue.maxsize
+        if maxsize <= 0 or backlog <= SHED_SPANS_THRESHOLD * maxsize:
+            return 1.0
+        steps = (backlog - SHED_SPANS_THRESHOLD * maxsize) // (SHED_SPANS_STEP * maxsize)
+        return 0.5 ** steps
+
+    def _record_dropped_span(self, reason: str) -> None:
+        dropped = next(self._dropped_spans)
+        now = time.monotonic()
+        if now - self._last_drop_warning >= 1:
+            self._last_drop_warning = now
+            self.logger.warning("%s (%d spans dropped so far)", reason, dropped)
+
+    def _keep_trace(self, trace_id: Any, backlog: int) -> bool:
+        # Decide per trace rather than per span so that the spans of a trace
+        # are kept or shed together instead of leaving every trace with
+        # random holes. Trace IDs are random, so their hash is spread evenly.
+        return (hash(trace_id) & 0xFFFFFFFF) / 2 ** 32 < self._keep_probability(backlog)
+
+    def send(self, span: Dict[str, Any]) -> None:
+        backlog = self.span_queue.qsize()
+        if backlog > self._shed_backlog and not self._keep_trace(span["traceId"], backlog):
+            self._record_dropped_span("Span recording queue is backed up, shedding traces.")
+            return
+
+        # Encode the span here rather than in the flush workers. This spreads
+        # the work over the threads finishing spans and lets workers build
+        # batches by simply joining the encoded spans.
+        if not self.span_queue.put(_dumps(span)):
+            self._record_dropped_span("Span recording queue is full, dropped the oldest span.")
 
 
 class LoggingRecorder(BaseBatchRecorder):
@@ -465,16 +696,21 @@ class LoggingRecorder(BaseBatchRecorder):
     def __init__(
         self,
         max_queue_size: int = 50000,
-        num_workers: int = 5,
+        num_workers: int = 2,
         max_span_batch: int = 100,
         batch_wait_interval: float = 0.5,
+        coalesce_window: float = 0.005,
     ):
-        super().__init__(max_queue_size, num_workers, max_span_batch, batch_wait_interval)
+        super().__init__(
+            max_queue_size, num_workers, max_span_batch, batch_wait_interval, coalesce_window
+        )
 
-    def flush_func(self, spans: List[Dict[str, Any]]) -> None:
+    def flush_func(self, spans: List[bytes]) -> None:
         """Write a set of spans to debug log."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         for span in spans:
-            self.logger.debug("Span recording: %s", span)
+            self.logger.debug("Span recording: %s", span.decode("utf8"))
 
 
 class NullRecorder(BaseBatchRecorder):
@@ -483,13 +719,19 @@ class NullRecorder(BaseBatchRecorder):
     def __init__(
         self,
         max_queue_size: int = 50000,
-        num_workers: int = 5,
+        num_workers: int = 2,
         max_span_batch: int = 100,
         batch_wait_interval: float = 0.5,
+        coalesce_window: float = 0.005,
     ):
-        super().__init__(max_queue_size, num_workers, max_span_batch, batch_wait_interval)
+        # Nothing is ever queued, so there's nothing for workers to flush.
+        # num_workers is still accepted to keep the signature compatible.
+        super().__init__(max_queue_size, 0, max_span_batch, batch_wait_interval, coalesce_window)
 
-    def flush_func(self, spans: List[Dict[str, Any]]) -> None:
+    def send(self, span: Dict[str, Any]) -> None:
+        return
+
+    def flush_func(self, spans: List[bytes]) -> None:
         return
 
 
@@ -505,25 +747,31 @@ class RemoteRecorder(BaseBatchRecorder):
         self,
         endpoint: str,
         num_conns: int = 5,
-        num_workers: int = 5,
+        num_workers: int = 2,
         max_queue_size: int = 50000,
         max_span_batch: int = 100,
         batch_wait_interval: float = 0.5,
+        coalesce_window: float = 0.005,
     ):
 
-        super().__init__(max_queue_size, num_workers, max_span_batch, batch_wait_interval)
+        super().__init__(
+            max_queue_size, num_workers, max_span_batch, batch_wait_interval, coalesce_window
+        )
         adapter = requests.adapters.HTTPAdapter(pool_connections=num_conns, pool_maxsize=num_conns)
         self.session = requests.Session()
         self.session.mount("http://", adapter)
         self.endpoint = f"http://{endpoint}/api/v1/spans"
 
-    def flush_func(self, spans: List[Dict[str, Any]]) -> None:
+    def flush_func(self, spans: List[bytes]) -> None:
         """Send a set of spans to remote collector."""
+        # Batches of spans compress very well, and the fastest compression
+        # level gets most of the benefit while keeping the CPU cost low.
+        body = gzip.compress(b"[" + b",".join(spans) + b"]", compresslevel=1)
         try:
             self.session.post(
                 self.endpoint,
-                data=json.dumps(spans).encode("utf8"),
-                headers={"Content-Type": "application/json"},
+                data=body,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
                 timeout=1,
             )
         except RequestException as e:
@@ -556,10 +804,10 @@ class SidecarRecorder(Recorder):
             max_message_size=MAX_SIDECAR_MESSAGE_SIZE,
         )
 
-    def send(self, span: TraceSpanObserver) -> None:
+    def send(self, span: Dict[str, Any]) -> None:
         # Don't raise exceptions from here. This is called in the
         # request/response path and should finish cleanly.
-        serialized_str = json.dumps(span._serialize()).encode("utf8")
+        serialized_str = json.dumps(span).encode("utf8")
         if len(serialized_str) > MAX_SIDECAR_MESSAGE_SIZE:
             logger.warning(
                 "Trace too big. Traces published to %s are not allowed to be larger "
@@ -616,7 +864,7 @@ def tracing_client_from_config(
                 "endpoint": config.Optional(config.Endpoint),
                 "queue_name": config.Optional(config.String),
                 "max_span_queue_size": config.Optional(config.Integer, default=50000),
-                "num_span_workers": config.Optional(config.Integer, default=5),
+                "num_span_workers": config.Optional(config.Integer, default=2),
                 "span_batch_interval": config.Optional(
                     config.Timespan, default=config.Timespan("500 milliseconds")
                 ),
@@ -40,19 +40,20 @@ def local_parent_trace_within_context(request):
 class TracingTests(unittest.TestCase):
     def _register_server_mock(self, context, server_span):
         server_span_observer = TraceServerSpanObserver(
-            "test-service", "test-hostname", server_span, NullRecorder()
+            "test-service", "test-hostname", server_span, self.recorder
         )
         server_span.register(server_span_observer)
-        self.server_span_observer = server_span_observer
 
     def _register_local_mock(self, span):
         local_span_observer = TraceLocalSpanObserver(
-            "test-service", "test-component", "test-hostname", span, NullRecorder()
+            "test-service", "test-component", "test-hostname", span, self.recorder
         )
         self.local_span_ids.append(span.id)
-        self.local_span_observers.append(local_span_observer)
         span.register(local_span_observer)
 
+    def _recorded_spans(self):
+        return [c[0][0] for c in self.recorder.send.call_args_list]
+
     def setUp(self):
         thread_patch = mock.patch("threading.Thread", autospec=True)
         thread_patch.start()
@@ -78,7 +79,7 @@ class TracingTests(unittest.TestCase):
         configurator.include(self.baseplate_configurator.includeme)
         app = configurator.make_wsgi_app()
         self.local_span_ids = []
-        self.local_span_observers = []
+        self.recorder = mock.Mock(spec=NullRecorder)
         self.test_app = webtest.TestApp(app)
 
     def test_trace_on_inbound_request(self):
@@ -86,7 +87,7 @@ class TracingTests(unittest.TestCase):
             TraceBaseplateObserver, "on_server_span_created", side_effect=self._register_server_mock
         ):
             self.test_app.get("/example")
-            span = self.server_span_observer._serialize()
+            span = self._recorded_spans()[-1]
             self.assertEqual(span["name"], "example")
             self.assertEqual(len(span["annotations"]), 2)
             self.assertEqual(span["parentId"], 0)
@@ -103,7 +104,8 @@ class TracingTests(unittest.TestCase):
             self.test_app.get("/local_test")
             # Verify that child span can be created within a local span context
             #  and parent IDs are inherited accordingly.
-            span = self.local_span_observers[-1]._serialize()
+            # The innermost local span finishes first.
+            span = self._recorded_spans()[0]
             self.assertEqual(span["name"], "local-req")
             self.assertEqual(len(span["annotations"]), 0)
             self.assertEqual(span["parentId"], self.local_span_ids[-2])
@@ -1,4 +1,9 @@
+import gzip
 import json
+import queue
+import socket
+import threading
+import time
 import unittest
 
 from unittest import mock
@@ -6,11 +11,15 @@ from unittest import mock
 from baseplate import ServerSpan
 from baseplate import Span
 from baseplate.lib.config import Endpoint
+from baseplate.observers.tracing import _local_ipv4
 from baseplate.observers.tracing import ANNOTATIONS
+from baseplate.observers.tracing import current_epoch_microseconds
 from baseplate.observers.tracing import LoggingRecorder
 from baseplate.observers.tracing import make_client
+from baseplate.observers.tracing import MAX_POOLED_OBSERVERS
 from baseplate.observers.tracing import NullRecorder
 from baseplate.observers.tracing import RemoteRecorder
+from baseplate.observers.tracing import SpanQueue
 from baseplate.observers.tracing import TraceBaseplateObserver
 from baseplate.observers.tracing import TraceLocalSpanObserver
 from baseplate.observers.tracing import TraceServerSpanObserver
@@ -24,6 +33,18 @@ class TraceTestBase(unittest.TestCase):
         self.addCleanup(thread_patch.stop)
 
 
+class CurrentEpochMicrosecondsTests(unittest.TestCase):
+    @mock.patch("time.time", autospec=True)
+    def test_current_epoch_microseconds(self, time_time):
+        time_time.return_value = 1234.5678901
+        self.assertEqual(current_epoch_microseconds(), 1234567890)
+
+    def test_current_epoch_microseconds_is_int(self):
+        now = current_epoch_microseconds()
+        self.assertIsInstance(now, int)
+        self.assertAlmostEqual(now / 1_000_000, time.time(), delta=1)
+
+
 class TraceObserverTests(TraceTestBase):
     def setUp(self):
         super().setUp()
@@ -44,6 +65,23 @@ class TraceObserverTests(TraceTestBase):
         baseplate_observer = TraceBaseplateObserver(client)
         self.assertIsNotNone(baseplate_observer.hostname)
 
+    @mock.patch("socket.gethostbyname", autospec=True, return_value="10.0.0.1")
+    def test_hostname_resolved_once(self, gethostbyname):
+        _local_ipv4.cache_clear()
+        self.addCleanup(_local_ipv4.cache_clear)
+        client = make_client("test-service")
+        TraceBaseplateObserver(client)
+        baseplate_observer = TraceBaseplateObserver(client)
+        self.assertEqual(baseplate_observer.hostname, "10.0.0.1")
+        self.assertEqual(gethostbyname.call_count, 1)
+
+    @mock.patch("socket.gethostbyname", autospec=True, side_effect=socket.gaierror)
+    def test_hostname_unresolvable(self, gethostbyname):
+        _local_ipv4.cache_clear()
+        self.addCleanup(_local_ipv4.cache_clear)
+        baseplate_observer = TraceBaseplateObserver(make_client("test-service"))
+        self.assertEqual(baseplate_observer.hostname, "undefined")
+
     def test_remote_recorder_setup(self):
         client = make_client("test-service", tracing_endpoint=Endpoint("test:1111"))
         baseplate_observer = TraceBaseplateObserver(client)
@@ -147,13 +185,13 @@ class TraceSpanObserverTests(TraceTestBase):
                 break
 
     def test_serialize_uses_span_info(self):
-        serialized_span = self.test_span_observer._serialize()
+        serialized_span = self.test_span_observer._serialize(1000, 1500)
         self.assertEqual(serialized_span["traceId"], self.span.trace_id)
         self.assertEqual(serialized_span["name"], self.span.name)
         self.assertEqual(serialized_span["id"], self.span.id)
 
     def test_serialize_adds_cs(self):
-        serialized_span = self.test_span_observer._serialize()
+        serialized_span = self.test_span_observer._serialize(1000, 1500)
         cs_in_annotation = False
         for annotation in serialized_span["annotations"]:
             if annotation["value"] == "cs":
@@ -161,7 +199,7 @@ class TraceSpanObserverTests(TraceTestBase):
         self.assertTrue(cs_in_annotation)
 
     def test_serialize_adds_cr(self):
-        serialized_span = self.test_span_observer._serialize()
+        serialized_span = self.test_span_observer._serialize(1000, 1500)
         cr_in_annotation = False
         for annotation in serialized_span["annotations"]:
             if annotation["value"] == "cr":
@@ -173,7 +211,7 @@ class TraceSpanObserverTests(TraceTestBase):
         self.test_span_observer.binary_annotations = []
 
         self.test_span_observer.on_set_tag("test-key", "test-value")
-        serialized_span = self.test_span_observer._serialize()
+        serialized_span = self.test_span_observer._serialize(1000, 1500)
         self.assertEqual(len(serialized_span["binaryAnnotations"]), 1)
         annotation = serialized_span["binaryAnnotations"][0]
         self.assertEqual(annotation["key"], "test-key")
@@ -186,19 +224,52 @@ class TraceSpanObserverTests(TraceTestBase):
         self.assertIsNotNone(self.test_span_observer.start)
 
     def test_on_finish_sets_end_timestamp_and_duration(self):
-        self.assertIsNone(self.test_span_observer.end)
-        self.test_span_observer.on_start()
-        self.test_span_observer.on_finish(None)
-        self.assertIsNotNone(self.test_span_observer.end)
+        with mock.patch.object(self.recorder, "send") as send:
+            self.test_span_observer.on_start()
+            self.test_span_observer.on_finish(None)
+        serialized_span = send.call_args[0][0]
+        self.assertIsNotNone(serialized_span["duration"])
+        end = serialized_span["timestamp"] + serialized_span["duration"]
+        self.assertEqual(serialized_span["annotations"][1]["timestamp"], end)
 
     def test_on_finish_records(self):
-        self.assertIsNone(self.test_span_observer.end)
-        self.test_span_observer.on_start()
-        self.test_span_observer.on_finish(None)
-        self.assertIsNotNone(self.test_span_observer.end)
+        with mock.patch.object(self.recorder, "send") as send:
+            self.test_span_observer.on_start()
+            self.test_span_observer.on_finish(None)
+        send.assert_called_once_with(mock.ANY)
+
+    @mock.patch("baseplate.observers.tracing.current_epoch_microseconds", autospec=True)
+    def test_serialize_computes_duration(self, current_epoch_microseconds):
+        current_epoch_microseconds.side_effect = [1000, 1500]
+        recorder = mock.Mock()
+        observer = TraceSpanObserver("test-service", "test-hostname", self.span, recorder)
+        observer.on_start()
+        observer.on_finish(None)
+        serialized_span = recorder.send.call_args[0][0]
+        self.assertEqual(serialized_span["timestamp"], 1000)
+        self.assertEqual(serialized_span["duration"], 500)
+
+    def test_on_finish_sends_serialized_span(self):
+        recorder = mock.Mock()
+        observer = TraceSpanObserver("test-service", "test-hostname", self.span, recorder)
+        observer.on_start()
+        observer.on_finish(None)
+        recorder.send.assert_called_once_with(mock.ANY)
+        serialized_span = recorder.send.call_args[0][0]
+        self.assertEqual(serialized_span["id"], self.span.id)
+        self.assertEqual(
+            [annotation["value"] for annotation in serialized_span["annotations"]], ["cs", "cr"]
+        )
+
+    def test_on_finish_twice_records_once(self):
+        recorder = mock.Mock()
+        observer = TraceSpanObserver("test-service", "test-hostname", self.span, recorder)
+        observer.on_start()
+        observer.on_finish(None)
+        observer.on_finish(None)
+        self.assertEqual(recorder.send.call_count, 1)
 
     def test_on_finish_sets_debug_annotation(self):
-        self.assertIsNone(self.test_debug_span_observer.end)
         self.test_debug_span_observer.on_start()
         self.test_debug_span_observer.on_finish(None)
         debug_annotation = None
@@ -210,7 +281,6 @@ class TraceSpanObserverTests(TraceTestBase):
         self.assertEqual(debug_annotation["value"], "true")
 
     def test_on_finish_sets_error_annotation(self):
-        self.assertIsNone(self.test_span_observer.end)
         self.test_span_observer.on_start()
         self.test_span_observer.on_finish((ValueError, ValueError(), None))
         error_annotation = None
@@ -233,6 +303,26 @@ class TraceSpanObserverTests(TraceTestBase):
         self.assertEquals(annotation["value"], "1")
         self.assertTrue(annotation["endpoint"])
 
+    def test_observers_use_slots(self):
+        observers = [
+            self.test_span_observer,
+            TraceServerSpanObserver("test-service", "test-hostname", self.span, self.recorder),
+            TraceLocalSpanObserver(
+                "test-service", "test-component", "test-hostname", self.span, self.recorder
+            ),
+        ]
+        for observer in observers:
+            self.assertFalse(hasattr(observer, "__dict__"))
+
+    def test_annotations_share_endpoint(self):
+        self.test_span_observer.on_set_tag("test-key", "test-value")
+        time_annotation = self.test_span_observer._create_time_annotation("cs", 0)
+        for annotation in self.test_span_observer.binary_annotations:
+            self.assertIs(annotation["endpoint"], time_annotation["endpoint"])
+        self.assertEqual(
+            time_annotation["endpoint"], {"serviceName": "test-service", "ipv4": "test-hostname"}
+        )
+
     def test_on_set_tag_adds_binary_annotation(self):
         self.test_span_observer.binary_annotations = []
         self.assertFalse(self.test_span_observer.binary_annotations)
@@ -242,14 +332,19 @@ class TraceSpanObserverTests(TraceTestBase):
         self.assertEquals(annotation["value"], "test-value")
 
     def test_to_span_obj_sets_parent_id(self):
-        span_obj = self.test_span_observer._to_span_obj([], [])
+        span_obj = self.test_span_observer._to_span_obj(1000, 1500, [], [])
         self.assertEqual(span_obj["parentId"], self.span.parent_id)
 
     def test_to_span_obj_sets_default_parent_id(self):
         self.span.parent_id = None
-        span_obj = self.test_span_observer._to_span_obj([], [])
+        span_obj = self.test_span_observer._to_span_obj(1000, 1500, [], [])
         self.assertEqual(span_obj["parentId"], 0)
 
+    def test_counters_allocated_on_first_incr(self):
+        self.assertIsNone(self.test_span_observer.counters)
+        self.test_span_observer.on_incr_tag("test-key", 1)
+        self.assertEqual(self.test_span_observer.counters, {"test-key": 1})
+
     def test_incr_tag_adds_binary_annotation(self):
         self.test_span_observer.binary_annotations = []
         self.test_span_observer.on_start()
@@ -261,6 +356,89 @@ class TraceSpanObserverTests(TraceTestBase):
         self.assertEquals(annotation["value"], "8.0")
 
 
+class TraceSpanObserverPoolTests(TraceTestBase):
+    def setUp(self):
+        super().setUp()
+        self.recorder = NullRecorder()
+        self.mock_context = mock.Mock()
+        for cls in (TraceSpanObserver, TraceServerSpanObserver):
+            pool_patch = mock.patch.object(cls, "_pool", [])
+            pool_patch.start()
+            self.addCleanup(pool_patch.stop)
+
+    def _make_span(self, name="test"):
+        return Span("test-id", "test-parent-id", "test-span-id", None, 0, name, self.mock_context)
+
+    def test_released_observer_is_reused(self):
+        observer = TraceSpanObserver(
+            "test-service", "test-hostname", self._make_span(), self.recorder
+        )
+        observer._release()
+        span = self._make_span("reused")
+        reused = TraceSpanObserver("test-service", "test-hostname", span, self.recorder)
+        self.assertIs(reused, observer)
+        self.assertIs(reused.span, span)
+        self.assertIsNone(reused.start)
+        self.assertEqual(len(reused.binary_annotations), 1)
+
+    def test_release_keeps_serialized_span_intact(self):
+        observer = TraceSpanObserver(
+            "test-service", "test-hostname", self._make_span(), self.recorder
+        )
+        observer.on_set_tag("test-key", "test-value")
+        serialized_span = observer._serialize(1000, 1500)
+        observer._release()
+        TraceSpanObserver("test-service", "test-hostname", self._make_span(), self.recorder)
+        self.assertEqual(len(serialized_span["binaryAnnotations"]), 2)
+
+    def test_on_finish_releases_observer(self):
+        observer = TraceSpanObserver(
+            "test-service", "test-hostname", self._make_span(), self.recorder
+        )
+        observer.on_start()
+        observer.on_finish(None)
+        self.assertEqual(TraceSpanObserver._pool, [observer])
+
+    def test_on_finish_twice_releases_once(self):
+        observer = TraceSpanObserver(
+            "test-service", "test-hostname", self._make_span(), self.recorder
+        )
+        observer.on_start()
+        observer.on_finish(None)
+        observer.on_finish(None)
+        a = TraceSpanObserver("test-service", "test-hostname", self._make_span(), self.recorder)
+        b = TraceSpanObserver("test-service", "test-hostname", self._make_span(), self.recorder)
+        self.assertIsNot(a, b)
+
+    def test_release_drops_span_and_recorder(self):
+        observer = TraceSpanObserver(
+            "test-service", "test-hostname", self._make_span(), self.recorder
+        )
+        observer._release()
+        self.assertFalse(hasattr(observer, "span"))
+        self.assertFalse(hasattr(observer, "recorder"))
+
+    def test_pool_is_per_class(self):
+        observer = TraceSpanObserver(
+            "test-service", "test-hostname", self._make_span(), self.recorder
+        )
+        observer._release()
+        server_observer = TraceServerSpanObserver(
+            "test-service", "test-hostname", self._make_span(), self.recorder
+        )
+        self.assertIsNot(server_observer, observer)
+        self.assertIsInstance(server_observer, TraceServerSpanObserver)
+
+    def test_pool_is_bounded(self):
+        observers = [
+            TraceSpanObserver("test-service", "test-hostname", self._make_span(), self.recorder)
+            for _ in range(MAX_POOLED_OBSERVERS + 1)
+        ]
+        for observer in observers:
+            observer._release()
+        self.assertEqual(len(TraceSpanObserver._pool), MAX_POOLED_OBSERVERS)
+
+
 class TraceServerSpanObserverTests(TraceTestBase):
     def setUp(self):
         super().setUp()
@@ -279,13 +457,13 @@ class TraceServerSpanObserverTests(TraceTestBase):
         self.assertTrue(issubclass(TraceServerSpanObserver, TraceSpanObserver))
 
     def test_serialize_uses_span_info(self):
-        serialized_span = self.test_server_span_observer._serialize()
+        serialized_span = self.test_server_span_observer._serialize(1000, 1500)
         self.assertEqual(serialized_span["traceId"], self.span.trace_id)
         self.assertEqual(serialized_span["name"], self.span.name)
         self.assertEqual(serialized_span["id"], self.span.id)
 
     def test_serialize_adds_ss(self):
-        serialized_span = self.test_server_span_observer._serialize()
+        serialized_span = self.test_server_span_observer._serialize(1000, 1500)
         ss_in_annotation = False
         for annotation in serialized_span["annotations"]:
             if annotation["value"] == "ss":
@@ -293,7 +471,7 @@ class TraceServerSpanObserverTests(TraceTestBase):
         self.assertTrue(ss_in_annotation)
 
     def test_serialize_adds_sr(self):
-        serialized_span = self.test_server_span_observer._serialize()
+        serialized_span = self.test_server_span_observer._serialize(1000, 1500)
         sr_in_annotation = False
         for annotation in serialized_span["annotations"]:
             if annotation["value"] == "sr":
@@ -310,6 +488,13 @@ class TraceServerSpanObserverTests(TraceTestBase):
         self.assertEqual(len(child_span.observers), 1)
         self.assertEqual(child_span.observers[0].span, child_span)
 
+    def test_on_child_span_created_shares_endpoint(self):
+        child_span = Span(
+            "child-id", "test-parent-id", "test-span-id", None, 0, "test-child", self.mock_context
+        )
+        self.test_server_span_observer.on_child_span_created(child_span)
+        self.assertIs(child_span.observers[0]._endpoint, self.test_server_span_observer._endpoint)
+
     def test_on_child_span_created_for_debug_span(self):
         child_span = Span(
             "child-id", "test-parent-id", "test-span-id", None, 1, "test-child", self.mock_context
@@ -357,12 +542,13 @@ class TraceLocalSpanObserverTests(TraceTestBase):
         )
 
     def test_serialize(self):
+        recorder = mock.Mock()
         local_trace_observer = TraceLocalSpanObserver(
-            "test-service", "test-component", "test-host", self.span, self.recorder
+            "test-service", "test-component", "test-host", self.span, recorder
         )
         local_trace_observer.on_start()
         local_trace_observer.on_finish(None)
-        serialized_span = local_trace_observer._serialize()
+        serialized_span = recorder.send.call_args[0][0]
         self.assertIsNotNone(serialized_span["duration"])
         self.assertEqual(serialized_span["name"], self.span.name)
         annotations = serialized_span["binaryAnnotations"]
@@ -378,11 +564,182 @@ class NullRecorderTests(TraceTestBase):
         self.recorder = NullRecorder()
         self.mock_context = mock.Mock()
 
+    def test_null_recorder_starts_no_workers(self):
+        self.assertEqual(self.recorder._workers, [])
+        threading.Thread.assert_not_called()
+
+    def test_null_recorder_send(self):
+        self.recorder.send({"id": 0})
+        self.assertEqual(self.recorder.span_queue.qsize(), 0)
+
     def test_null_recorder_flush(self):
         span = Span("test-id", "test-parent-id", "test-span-id", None, 0, "test", self.mock_context)
         self.recorder.flush_func([span])
 
 
+class SpanQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.queue = SpanQueue(maxsize=2)
+
+    def test_fifo(self):
+        self.assertTrue(self.queue.put(b"0"))
+        self.assertTrue(self.queue.put(b"1"))
+        self.assertEqual(self.queue.qsize(), 2)
+        self.assertEqual(self.queue.get_nowait(), b"0")
+        self.assertEqual(self.queue.get(timeout=0), b"1")
+
+    def test_full_drops_oldest(self):
+        self.queue.put(b"0")
+        self.queue.put(b"1")
+        self.assertFalse(self.queue.put(b"2"))
+        self.assertEqual(self.queue.qsize(), 2)
+        self.assertEqual(self.queue.get_nowait(), b"1")
+
+    def test_empty(self):
+        with self.assertRaises(queue.Empty):
+            self.queue.get_nowait()
+        with self.assertRaises(queue.Empty):
+            self.queue.get(timeout=0.01)
+
+    def test_unbounded(self):
+        unbounded_queue = SpanQueue(maxsize=0)
+        for i in range(10):
+            self.assertTrue(unbounded_queue.put(b"0"))
+        self.assertEqual(unbounded_queue.qsize(), 10)
+
+    def test_get_wakes_up_on_put(self):
+        timer = threading.Timer(0.01, self.queue.put, args=(b"0",))
+        timer.start()
+        self.addCleanup(timer.join)
+        self.assertEqual(self.queue.get(timeout=5), b"0")
+
+
+class BaseBatchRecorderTests(TraceTestBase):
+    def setUp(self):
+        super().setUp()
+        self.recorder = LoggingRecorder(max_span_batch=2, batch_wait_interval=0.01)
+
+    def _decode(self, spans):
+        return [json.loads(span) for span in spans]
+
+    def test_workers(self):
+        recorder = LoggingRecorder(num_workers=3)
+        self.assertEqual(len(recorder._workers), 3)
+        self.assertEqual(
+            [c[1]["name"] for c in threading.Thread.call_args_list[-3:]],
+            ["span-recorder-0", "span-recorder-1", "span-recorder-2"],
+        )
+
+    def test_send_encodes_span(self):
+        self.recorder.send({"id": 0})
+        self.assertEqual(json.loads(self.recorder.span_queue.get_nowait()), {"id": 0})
+
+    def test_send_encodes_span_without_orjson(self):
+        with mock.patch("baseplate.observers.tracing.orjson", None):
+            self.recorder.send({"id": 0})
+        self.assertEqual(self.recorder.span_queue.get_nowait(), b'{"id": 0}')
+
+    def test_send_logs_when_full(self):
+        recorder = LoggingRecorder(max_queue_size=1)
+        with mock.patch.object(recorder, "logger") as logger:
+            # a trace ID hashing to 0 is kept even while spans are being shed
+            recorder.send({"traceId": 0, "id": 0})
+            self.assertFalse(logger.warning.called)
+            recorder.send({"traceId": 0, "id": 1})
+            self.assertTrue(logger.warning.called)
+        self.assertEqual(json.loads(recorder.span_queue.get_nowait()), {"traceId": 0, "id": 1})
+
+    def test_keep_probability(self):
+        recorder = LoggingRecorder(max_queue_size=100)
+        self.assertEqual(recorder._keep_probability(0), 1)
+        self.assertEqual(recorder._keep_probability(80), 1)
+        self.assertEqual(recorder._keep_probability(84), 1)
+        self.assertEqual(recorder._keep_probability(85), 0.5)
+        self.assertEqual(recorder._keep_probability(90), 0.25)
+        self.assertEqual(recorder._keep_probability(100), 0.0625)
+
+    def test_keep_probability_unbounded_queue(self):
+        recorder = LoggingRecorder(max_queue_size=0)
+        self.assertEqual(recorder._keep_probability(1000), 1)
+
+    def test_send_sheds_whole_traces_when_backed_up(self):
+        recorder = LoggingRecorder(max_queue_size=100)
+        for i in range(90):
+            recorder.span_queue.put(b"0")
+        # at 90% full a quarter of traces are kept: trace IDs hashing below
+        # 2**30 are kept and the rest are shed.
+        kept_trace, shed_trace = 2 ** 29, 2 ** 31
+        with mock.patch.object(recorder, "logger") as logger:
+            recorder.send({"traceId": shed_trace, "id": 0})
+            recorder.send({"traceId": shed_trace, "id": 1})
+            self.assertEqual(recorder.span_queue.qsize(), 90)
+            self.assertTrue(logger.warning.called)
+            recorder.send({"traceId": kept_trace, "id": 2})
+            recorder.send({"traceId": kept_trace, "id": 3})
+            self.assertEqual(recorder.span_queue.qsize(), 92)
+
+    def test_send_skips_shedding_below_threshold(self):
+        recorder = LoggingRecorder(max_queue_size=100)
+        with mock.patch.object(recorder, "_keep_trace") as keep_trace:
+            recorder.send({"id": 0})
+            self.assertFalse(keep_trace.called)
+        self.assertEqual(recorder.span_queue.qsize(), 1)
+
+    @mock.patch("time.monotonic", autospec=True)
+    def test_dropped_span_warning_rate_limited(self, monotonic):
+        monotonic.return_value = 100
+        with mock.patch.object(self.recorder, "logger") as logger:
+            self.recorder._record_dropped_span("test")
+            self.recorder._record_dropped_span("test")
+            self.assertEqual(logger.warning.call_count, 1)
+            monotonic.return_value = 101
+            self.recorder._record_dropped_span("test")
+            self.assertEqual(logger.warning.call_count, 2)
+            logger.warning.assert_called_with("%s (%d spans dropped so far)", "test", 3)
+
+    def test_logging_flush_skips_decoding_unless_debug(self):
+        span = mock.Mock(spec=bytes)
+        with mock.patch.object(self.recorder, "logger") as logger:
+            logger.isEnabledFor.return_value = False
+            self.recorder.flush_func([span])
+            self.assertFalse(span.decode.called)
+            self.assertFalse(logger.debug.called)
+
+            logger.isEnabledFor.return_value = True
+            self.recorder.flush_func([b'{"id": 0}'])
+            logger.debug.assert_called_once_with("Span recording: %s", '{"id": 0}')
+
+    def test_get_batch_empty_queue(self):
+        self.assertEqual(self.recorder._get_batch(), [])
+
+    def test_get_batch_single_span(self):
+        self.recorder.send({"id": 1})
+        self.assertEqual(self._decode(self.recorder._get_batch()), [{"id": 1}])
+
+    def test_get_batch_respects_max_span_batch(self):
+        for i in range(3):
+            self.recorder.send({"id": i})
+        self.assertEqual(self._decode(self.recorder._get_batch()), [{"id": 0}, {"id": 1}])
+        self.assertEqual(self._decode(self.recorder._get_batch()), [{"id": 2}])
+
+    def test_get_batch_waits_for_coalesce_window(self):
+        recorder = LoggingRecorder(max_span_batch=3, batch_wait_interval=0.5, coalesce_window=1)
+        recorder.span_queue = mock.Mock()
+        recorder.span_queue.get.side_effect = [b"0", b"1", queue.Empty]
+        self.assertEqual(recorder._get_batch(), [b"0", b"1"])
+        first_call, second_call, third_call = recorder.span_queue.get.call_args_list
+        self.assertEqual(first_call, mock.call(timeout=0.5))
+        self.assertLessEqual(second_call[1]["timeout"], 1)
+        self.assertLessEqual(third_call[1]["timeout"], second_call[1]["timeout"])
+        self.assertFalse(recorder.span_queue.get_nowait.called)
+
+    def test_get_batch_drains_queue_after_coalesce_window(self):
+        recorder = LoggingRecorder(max_span_batch=3, batch_wait_interval=0.01, coalesce_window=0)
+        for i in range(2):
+            recorder.send({"id": i})
+        self.assertEqual(self._decode(recorder._get_batch()), [{"id": 0}, {"id": 1}])
+
+
 class RemoteRecorderTests(TraceTestBase):
     def setUp(self):
         super().setUp()
@@ -405,10 +762,20 @@ class RemoteRecorderTests(TraceTestBase):
         }
         func_mock = mock.Mock()
         with mock.patch.object(recorder.session, "post", func_mock):
-            recorder.flush_func([serialized_span])
+            recorder.flush_func([json.dumps(serialized_span).encode("utf8")])
             func_mock.assert_called_with(
                 recorder.endpoint,
-                data=json.dumps([serialized_span]).encode("utf8"),
-                headers={"Content-Type": "application/json"},
+                data=mock.ANY,
+                headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
                 timeout=1,
             )
+            data = gzip.decompress(func_mock.call_args[1]["data"])
+            self.assertEqual(json.loads(data), [serialized_span])
+
+    def test_remote_recorder_flush_joins_encoded_spans(self):
+        recorder = RemoteRecorder(self.endpoint, 5)
+        func_mock = mock.Mock()
+        with mock.patch.object(recorder.session, "post", func_mock):
+            recorder.flush_func([b'{"id":0}', b'{"id":1}'])
+            data = gzip.decompress(func_mock.call_args[1]["data"])
+            self.assertEqual(data, b'[{"id":0},{"id":1}]')